@@ -1,6 +1,12 @@
 import minimalmodbus
 import serial
+import serial.tools.list_ports
 import enum
+import types
+import queue
+import threading
+import time
+import weakref
 
 
 class ParamName(enum.Enum):
@@ -54,16 +60,19 @@ class DataGroup(enum.Enum):
 
 class ParamInfo:
     """
-    'Data class' containing all information about a parameter
+    Immutable 'data class' containing all information about a parameter
 
     :param read: read access flag
     :param write: write access flag
     :param unit: scientific unit of parameter
     :param description: human readable value description
-    :param value_range: value range of parameter
+    :param value_range: static value range of parameter (None, if it depends on the device)
     :param integer: flag indicating only integer values are allowed
+    :param decimals: number of decimals of the register value (defaults to 0 for integers, 2 otherwise)
     """
-    def __init__(self, read, write, unit, description, value_range=None, integer=False):
+    __slots__ = ("read", "write", "unit", "description", "value_range", "integer", "decimals")
+
+    def __init__(self, read, write, unit, description, value_range=None, integer=False, decimals=None):
         """
         Class constructor
 
@@ -71,15 +80,338 @@ class ParamInfo:
         :param write: write access flag
         :param unit: scientific unit of parameter
         :param description: human readable value description
-        :param value_range: value range of parameter
+        :param value_range: static value range of parameter (None, if it depends on the device)
         :param integer: flag indicating only integer values are allowed
+        :param decimals: number of decimals of the register value (defaults to 0 for integers, 2 otherwise)
+        """
+        if value_range is not None:
+            value_range = tuple(value_range)
+        if decimals is None:
+            decimals = 0 if integer else 2
+        values = (read, write, unit, description, value_range, integer, decimals)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParamInfo is immutable")
+
+
+def _lookup(table, attribute):
+    """
+    Build a lookup array of one attribute of a descriptor table, indexed by register address
+
+    :param table: Dictionary of :class:`ParamInfo` with consecutive addresses starting at zero
+    :param attribute: name of the :class:`ParamInfo` attribute
+    :return: tuple containing the attribute of every register
+    """
+    return tuple(getattr(table[address], attribute) for address in range(len(table)))
+
+
+class WindowStatistics:
+    """
+    Running min/max/mean/RMS statistics of a value stream, using constant memory
+    """
+    def __init__(self):
+        """
+        Class constructor
+        """
+        self.count = 0          #: number of values
+        self.minimum = None     #: smallest value
+        self.maximum = None     #: largest value
+        self.total = 0.0        #: sum of all values
+        self.total_sq = 0.0     #: sum of all squared values
+
+    def add(self, value):
+        """
+        Add a single value to the statistics
+
+        :param value: value to add
+        :return:
+        """
+        if self.count == 0:
+            self.minimum = value
+            self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+
+    def merge(self, other):
+        """
+        Merge the statistics of another instance into this one
+
+        :param other: :class:`WindowStatistics` to merge
+        :return:
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.minimum = other.minimum
+            self.maximum = other.maximum
+        else:
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+
+    @property
+    def mean(self):
+        """
+        Arithmetic mean of all values, None if empty
+        """
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    @property
+    def rms(self):
+        """
+        Root mean square of all values, None if empty
+        """
+        if self.count == 0:
+            return None
+        return (self.total_sq / self.count) ** 0.5
+
+
+class TumblingWindow:
+    """
+    Statistics over consecutive, non-overlapping time windows
+
+    Only the currently running and the last completed window are kept.
+
+    :param length: window length in seconds
+    """
+    def __init__(self, length):
+        """
+        Class constructor
+
+        :param length: window length in seconds
+        """
+        self.length = length                #: window length in seconds
+        self.start = None                   #: start time of the running window
+        self.current = WindowStatistics()   #: statistics of the running window
+        self.last = None                    #: statistics of the last completed window
+
+    def add(self, value, timestamp):
+        """
+        Add a value to the window, closing the running window if its time is up
+
+        :param value: value to add
+        :param timestamp: timestamp of the value in seconds
+        :return:
+        """
+        if self.start is None:
+            self.start = timestamp
+        elif timestamp >= self.start + self.length:
+            if self.current.count:
+                self.last = self.current
+            self.start += ((timestamp - self.start) // self.length) * self.length
+            self.current = WindowStatistics()
+        self.current.add(value)
+
+
+class RollingWindow:
+    """
+    Statistics over a sliding time window
+
+    The window is split into a fixed number of buckets, so memory stays constant regardless of the sample rate. The
+    window slides with the resolution of one bucket.
+
+    :param length: window length in seconds
+    :param buckets: number of buckets the window is split into
+    """
+    def __init__(self, length, buckets=60):
+        """
+        Class constructor
+
+        :param length: window length in seconds
+        :param buckets: number of buckets the window is split into
+        """
+        self.length = length                    #: window length in seconds
+        self.bucket_length = length / buckets   #: length of a single bucket in seconds
+        self._buckets = [WindowStatistics() for _ in range(buckets)]
+        self._numbers = [None] * buckets
+        self._latest = None
+
+    def add(self, value, timestamp):
+        """
+        Add a value to the window
+
+        :param value: value to add
+        :param timestamp: timestamp of the value in seconds
+        :return:
+        """
+        number = int(timestamp // self.bucket_length)
+        if self._latest is not None and number <= self._latest - len(self._buckets):
+            return
+        slot = number % len(self._buckets)
+        if self._numbers[slot] != number:
+            self._buckets[slot] = WindowStatistics()
+            self._numbers[slot] = number
+        self._buckets[slot].add(value)
+        if self._latest is None or number > self._latest:
+            self._latest = number
+
+    def get_statistics(self):
+        """
+        Get the statistics of all values inside the window, relative to the newest value
+
+        :return: :class:`WindowStatistics` of the window
+        """
+        statistics = WindowStatistics()
+        if self._latest is None:
+            return statistics
+        oldest = self._latest - len(self._buckets)
+        for number, bucket in zip(self._numbers, self._buckets):
+            if number is not None and number > oldest:
+                statistics.merge(bucket)
+        return statistics
+
+
+class MeasurementAccumulator:
+    """
+    Streaming accumulator for measurement data of the power supply
+
+    Integrates energy (Wh) and charge (Ah) and keeps rolling and tumbling window statistics of every measurement
+    channel, without retaining any raw samples. Feed it with the dictionaries returned by
+    :meth:`PyDPS.get_all_measurements` or attach it to a :class:`PyDPS` instance via :meth:`PyDPS.add_accumulator`.
+
+    Integration uses the trapezoidal rule. If two samples are further apart than ``max_gap``, the interval is not
+    integrated but counted as gap instead.
+
+    :param window_length: length of the rolling and tumbling windows in seconds
+    :param max_gap: maximum time between two samples in seconds, which is still integrated
+    :param buckets: number of buckets of the rolling windows
+    """
+    #: Accumulated measurement channels
+    CHANNELS = (ParamName.U_OUT, ParamName.I_OUT, ParamName.P_OUT)
+
+    def __init__(self, window_length=60.0, max_gap=5.0, buckets=60):
+        """
+        Class constructor
+
+        :param window_length: length of the rolling and tumbling windows in seconds
+        :param max_gap: maximum time between two samples in seconds, which is still integrated
+        :param buckets: number of buckets of the rolling windows
+        """
+        self.window_length = window_length  #: length of the rolling and tumbling windows in seconds
+        self.max_gap = max_gap              #: maximum time between two samples in seconds, which is still integrated
+        self.buckets = buckets              #: number of buckets of the rolling windows
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all integrals and statistics
+
+        :return:
+        """
+        self.energy = 0.0               #: integrated energy in Wh
+        self.charge = 0.0               #: integrated charge in Ah
+        self.integrated_time = 0.0      #: time covered by the integrals in seconds
+        self.gap_count = 0              #: number of intervals not integrated due to timestamp gaps
+        self.gap_time = 0.0             #: total time of all gaps in seconds
+        self.sample_count = 0           #: number of accumulated samples
+        self._last_timestamp = None
+        self._last_power = None
+        self._last_current = None
+        self._rolling = {name: RollingWindow(self.window_length, self.buckets) for name in self.CHANNELS}
+        self._tumbling = {name: TumblingWindow(self.window_length) for name in self.CHANNELS}
+
+    def add(self, data, timestamp=None):
+        """
+        Add a measurement sample
+
+        :param data: Dictionary of measurement values. Accessible via :class:`ParamName` enum
+        :param timestamp: timestamp of the sample in seconds (defaults to :func:`time.monotonic`)
+        :return:
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        current = data.get(ParamName.I_OUT)
+        power = data.get(ParamName.P_OUT)
+        if power is None and current is not None and ParamName.U_OUT in data:
+            power = data[ParamName.U_OUT] * current
+
+        if self._last_timestamp is not None:
+            delta = timestamp - self._last_timestamp
+            if delta > self.max_gap:
+                self.gap_count += 1
+                self.gap_time += delta
+            elif delta > 0:
+                self.integrated_time += delta
+                if power is not None and self._last_power is not None:
+                    self.energy += (power + self._last_power) * 0.5 * delta / 3600
+                if current is not None and self._last_current is not None:
+                    self.charge += (current + self._last_current) * 0.5 * delta / 3600
+
+        if self._last_timestamp is None or timestamp > self._last_timestamp:
+            self._last_timestamp = timestamp
+            self._last_power = power
+            self._last_current = current
+
+        for name in self.CHANNELS:
+            if name in data:
+                self._rolling[name].add(data[name], timestamp)
+                self._tumbling[name].add(data[name], timestamp)
+        self.sample_count += 1
+
+    def get_rolling_statistics(self, channel):
+        """
+        Get the statistics of the rolling window of a channel
+
+        :param channel: :class:`ParamName` enum of the channel or its unit e.g. "V"
+        :return: :class:`WindowStatistics` of the last ``window_length`` seconds
+        """
+        return self._rolling[self._check_channel(channel)].get_statistics()
+
+    def get_tumbling_statistics(self, channel):
+        """
+        Get the statistics of the last completed tumbling window of a channel
+
+        :param channel: :class:`ParamName` enum of the channel or its unit e.g. "V"
+        :return: :class:`WindowStatistics` of the last completed window, None if no window is completed yet
+        """
+        return self._tumbling[self._check_channel(channel)].last
+
+    def _check_channel(self, channel):
+        """
+        Resolve a channel given by enum or unit. Raise an error, if the channel is unknown
+
+        :param channel: :class:`ParamName` enum of the channel or its unit
+        :return: :class:`ParamName` enum of the channel
+        """
+        if channel in self.CHANNELS:
+            return channel
+        for name in self.CHANNELS:
+            if PyDPS.ParameterInfo[name.value].unit == channel:
+                return name
+        raise ValueError("The channel is not known")
+
+
+class _Transaction:
+    """
+    A single ModBus transaction, queued for the I/O worker of a thread-safe :class:`PyDPS`
+
+    :param functioncode: ModBus function code
+    :param payload: payload to send to the slave
+    """
+    def __init__(self, functioncode, payload):
         """
-        self.read = read                #: read access flag
-        self.write = write              #: write access flag
-        self.unit = unit                #: scientific unit of parameter
-        self.description = description  #: human readable value description
-        self.value_range = value_range  #: value range of parameter
-        self.integer = integer          #: flag indicating only integer values are allowed
+        Class constructor
+
+        :param functioncode: ModBus function code
+        :param payload: payload to send to the slave
+        """
+        self.functioncode = functioncode
+        self.payload = payload
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        self.fed = False
 
 
 class PyDPS(minimalmodbus.Instrument):
@@ -90,20 +422,100 @@ class PyDPS(minimalmodbus.Instrument):
     :class:`minimalmodbus.Instrument` class to take care of the low-level ModBus implementation and provides a boiler
     plate to easily access and control the power supply, without the need of remembering register addresses
 
-    :param port_name: ParamName of the COM port as string
+    If ``thread_safe`` is set, a single instance can be shared between threads. All ModBus transactions are then
+    executed one after another by an internal I/O worker thread. Concurrent reads of the same register span are
+    answered by one single transaction.
+
+    If ``reconnect`` is set, a broken serial port (e.g. after a reset of the USB-serial adapter) is reopened
+    automatically with exponential backoff and the failed transaction is repeated. If the device node changes, the
+    adapter is found again by its USB serial number or location. The device profile is kept, so no re-probing is
+    necessary. A profile returned by :meth:`get_profile` can also be passed to a new instance to skip the probe.
+
+    :param port_name: ParamName of the COM port as string (may be None, if ``serial_number`` or ``location`` is given)
     :param slave_address: Slave address (defaults to one)
+    :param thread_safe: serialize all transactions through an internal I/O worker
+    :param reconnect: automatically reopen the serial port after communication failures
+    :param serial_number: USB serial number of the adapter, used to find the port
+    :param location: USB location (path) of the adapter, used to find the port
+    :param profile: device profile from :meth:`get_profile`, skips probing the device
     """
 
-    def __init__(self, port_name, slave_address=1):
+    #: ModBus function codes of read transactions, which may be shared between concurrent callers
+    SHARED_FUNCTION_CODES = (1, 2, 3, 4)
+
+    # --------------------------------------------------------
+    # Register descriptor tables, shared between all instances
+    # --------------------------------------------------------
+    #: Dictionary containing information about every parameter
+    ParameterInfo = types.MappingProxyType({
+        ParamName.U_SET.value: ParamInfo(True, True, "V", "Set voltage"),
+        ParamName.I_SET.value: ParamInfo(True, True, "A", "Set current"),
+        ParamName.U_OUT.value: ParamInfo(True, False, "V", "Measured output voltage"),
+        ParamName.I_OUT.value: ParamInfo(True, False, "A", "Measured output current"),
+        ParamName.P_OUT.value: ParamInfo(True, False, "W", "Measured output power"),
+        ParamName.U_IN.value: ParamInfo(True, False, "V", "Measured input voltage"),
+        ParamName.LOCK.value: ParamInfo(True, True, "-", "Key lock", [0, 1], True),
+        ParamName.PROTECT.value: ParamInfo(True, False, "-", "Protection status", integer=True),
+        ParamName.CV_CC.value: ParamInfo(True, False, "-", "Operation status (constant voltage or current)",
+                                         integer=True),
+        ParamName.ON_OFF.value: ParamInfo(True, True, "-", "Output active state", [0, 1], True),
+        ParamName.B_LED.value: ParamInfo(True, True, "-", "Backlight brightness level", [0, 5], True),
+        ParamName.MODEL.value: ParamInfo(True, False, "-", "Product model", integer=True),
+        ParamName.VERSION.value: ParamInfo(True, False, "-", "Firmware version", integer=True),
+    })
+
+    #: Dictionary containing info about every setting
+    SettingInfo = types.MappingProxyType({
+        SettingName.U_SET.value: ParamInfo(True, True, "V", "Set voltage"),
+        SettingName.I_SET.value: ParamInfo(True, True, "A", "Set current"),
+        SettingName.OVP.value: ParamInfo(True, True, "V", "Over-voltage protection value"),
+        SettingName.OCP.value: ParamInfo(True, True, "A", "Over-current protection value"),
+        SettingName.OPP.value: ParamInfo(True, True, "W", "Over-power protection value"),
+        SettingName.B_LED.value: ParamInfo(True, True, "-", "Backlight brightness level", [0, 5], True),
+        SettingName.M_PRE.value: ParamInfo(True, True, "-", "Memory preset number", [0, 9], True),
+        SettingName.INI.value: ParamInfo(True, True, "-", "Power output switch", [0, 1], True),
+    })
+
+    # Lookup arrays indexed by register address, precomputed from the descriptor tables
+    _PARAMETER_NAMES = tuple(ParamName(address) for address in range(len(ParameterInfo)))
+    _PARAMETER_WRITABLE = _lookup(ParameterInfo, "write")
+    _PARAMETER_INTEGER = _lookup(ParameterInfo, "integer")
+    _PARAMETER_DECIMALS = _lookup(ParameterInfo, "decimals")
+    _PARAMETER_SCALES = tuple(10.0 ** -decimals for decimals in _PARAMETER_DECIMALS)
+    _PARAMETER_RANGES = _lookup(ParameterInfo, "value_range")
+    _SETTING_RANGES = _lookup(SettingInfo, "value_range")
+
+    @staticmethod
+    def _split_model(model):
+        """
+        Split the raw value of the model register into the rated voltage and current, e.g. 5015 into 50 V and 15 A
+
+        :param model: raw value of the :attr:`ParamName.MODEL` register
+        :return: tuple of rated voltage and current
+        """
+        return divmod(model, 100)
+
+    def __init__(self, port_name, slave_address=1, thread_safe=False, reconnect=False, serial_number=None,
+                 location=None, profile=None):
         """
         Class constructor
 
-        :param port_name: ParamName of the COM port as string
+        :param port_name: ParamName of the COM port as string (may be None, if ``serial_number`` or ``location`` is
+            given)
         :param slave_address: Slave address (defaults to one)
+        :param thread_safe: serialize all transactions through an internal I/O worker
+        :param reconnect: automatically reopen the serial port after communication failures
+        :param serial_number: USB serial number of the adapter, used to find the port
+        :param location: USB location (path) of the adapter, used to find the port
+        :param profile: device profile from :meth:`get_profile`, skips probing the device
         """
         # --------------------------------
         # Initialize the modbus connection
         # --------------------------------
+        if port_name is None:
+            port_name = self._find_port(serial_number, location)
+            if port_name is None:
+                raise ValueError("No serial port found for the given adapter")
         minimalmodbus.Instrument.__init__(self, port_name, slave_address, mode='rtu')
         self.serial.baudrate = 9600
         self.serial.bytesize = 8
@@ -111,56 +523,119 @@ class PyDPS(minimalmodbus.Instrument):
         self.serial.stopbits = 1
         self.serial.timeout = 0.5
 
+        # -----------------------------------
+        # Remember the adapter for reconnects
+        # -----------------------------------
+        self.reconnect = reconnect          #: flag enabling automatic reconnection
+        self.reconnect_delay = 0.05         #: initial delay between reconnection attempts in seconds
+        self.reconnect_max_delay = 1.0      #: maximum delay between reconnection attempts in seconds
+        self.reconnect_timeout = 10.0       #: time in seconds after which reconnection is given up
+        self.reconnect_count = 0            #: number of successful reconnections
+        self.serial_number = serial_number  #: USB serial number of the adapter
+        self.location = location            #: USB location (path) of the adapter
+        if reconnect and serial_number is None and location is None:
+            for port in serial.tools.list_ports.comports():
+                if port.device == port_name:
+                    self.serial_number = port.serial_number
+                    self.location = port.location
+
+        #: List of :class:`MeasurementAccumulator` fed with every measurement query
+        self.accumulators = []
+        self._accumulator_lock = threading.Lock()
+
         # ----------------------------------------
-        # Populate the parameter info dictionaries
+        # Start the I/O worker in thread safe mode
         # ----------------------------------------
-        #: Dictionary containing information about every parameter
-        self.ParameterInfo = {
-            ParamName.U_SET.value: ParamInfo(True, True, "V", "Set voltage"),
-            ParamName.I_SET.value: ParamInfo(True, True, "A", "Set current"),
-            ParamName.U_OUT.value: ParamInfo(True, False, "V", "Measured output voltage"),
-            ParamName.I_OUT.value: ParamInfo(True, False, "A", "Measured output current"),
-            ParamName.P_OUT.value: ParamInfo(True, False, "W", "Measured output power"),
-            ParamName.U_IN.value: ParamInfo(True, False, "V", "Measured input voltage"),
-            ParamName.LOCK.value: ParamInfo(True, True, "-", "Key lock", [0, 1], True),
-            ParamName.PROTECT.value: ParamInfo(True, False, "-", "Protection status"),
-            ParamName.CV_CC.value: ParamInfo(True, False, "-", "Operation status (constant voltage or current)"),
-            ParamName.ON_OFF.value: ParamInfo(True, True, "-", "Output active state", [0, 1], True),
-            ParamName.B_LED.value: ParamInfo(True, True, "-", "Backlight brightness level", [0, 5], True),
-            ParamName.MODEL.value: ParamInfo(True, False, "-", "Product model"),
-            ParamName.VERSION.value: ParamInfo(True, False, "-", "Firmware version"),
-        }
-
-        #: Dictionary containing info about every setting
-        self.SettingInfo = {
-            SettingName.U_SET.value: ParamInfo(True, True, "V", "Set voltage"),
-            SettingName.I_SET.value: ParamInfo(True, True, "A", "Set current"),
-            SettingName.OVP.value: ParamInfo(True, True, "V", "Over-voltage protection value"),
-            SettingName.OCP.value: ParamInfo(True, True, "A", "Over-current protection value"),
-            SettingName.OPP.value: ParamInfo(True, True, "W", "Over-power protection value"),
-            SettingName.B_LED.value: ParamInfo(True, True, "-", "Backlight brightness level", [0, 5], True),
-            SettingName.M_PRE.value: ParamInfo(True, True, "-", "Memory preset number", [0, 9], True),
-            SettingName.INI.value: ParamInfo(True, True, "-", "Power output switch", [0, 1], True),
+        self.thread_safe = thread_safe  #: flag indicating all transactions run through the I/O worker
+        self._transactions = queue.Queue()
+        self._in_flight = {}
+        self._outstanding = 0
+        self._io_lock = threading.Lock()
+        self._local = threading.local()
+        self._io_statistics = {
+            "requests": 0,
+            "transactions": 0,
+            "deduplicated": 0,
+            "contended": 0,
+            "max_queue_depth": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
         }
+        self._closed = False
+        self._worker = None
+        if thread_safe:
+            # The worker only holds a weak reference, so unused instances get collected and stop their worker
+            self._worker = threading.Thread(target=self._io_worker, args=(weakref.ref(self), self._transactions),
+                                            name="pydps-io", daemon=True)
+            self._stop_worker = weakref.finalize(self, self._transactions.put, None)
+            self._worker.start()
 
         # --------------------------------------------------------------------
         # Coerce initial information with data from the connected power supply
         # --------------------------------------------------------------------
-        model = str(self.get_model())
-        voltage = int(model.split(".")[0])
-        current = int(model.split(".")[1])
+        #: Value ranges of all parameters, overlaid with the device dependent ranges
+        self._parameter_ranges = list(self._PARAMETER_RANGES)
+        #: Value ranges of all settings, overlaid with the device dependent ranges
+        self._setting_ranges = list(self._SETTING_RANGES)
+        if profile is None:
+            profile = {
+                "model": self._read_parameter(ParamName.MODEL),
+                "input_voltage": self.get_input_voltage(),
+            }
+        self._apply_profile(profile)
+
+    def get_profile(self):
+        """
+        Get the device profile, which determines the allowed value ranges
+
+        The profile can be passed to the constructor of a new instance to skip probing the device.
+
+        :return: Dictionary containing the raw model register value (e.g. 5015) and the input voltage at connection time
+        """
+        return dict(self._profile)
+
+    def _apply_profile(self, profile):
+        """
+        Coerce the value ranges of parameters and settings with the device profile
+
+        :param profile: Dictionary containing the raw model register value and the input voltage
+        :return:
+        """
+        self._profile = dict(profile)
+        voltage, current = self._split_model(profile["model"])
 
         max_current = current
-        max_voltage = self.get_input_voltage() / 1.1
+        max_voltage = profile["input_voltage"] / 1.1
+
+        self._parameter_ranges[ParamName.U_SET.value] = (0, max_voltage)
+        self._parameter_ranges[ParamName.I_SET.value] = (0, max_current)
+
+        self._setting_ranges[SettingName.U_SET.value] = (0, max_voltage)
+        self._setting_ranges[SettingName.I_SET.value] = (0, max_current)
+        self._setting_ranges[SettingName.OVP.value] = (0, voltage * 1.02)
+        self._setting_ranges[SettingName.OCP.value] = (0, current * 1.01)
+        self._setting_ranges[SettingName.OPP.value] = (0, current * voltage * 1.01)
 
-        self.ParameterInfo[ParamName.U_SET.value].value_range = [0, max_voltage]
-        self.ParameterInfo[ParamName.I_SET.value].value_range = [0, max_current]
+    def get_value_range(self, name):
+        """
+        Get the allowed value range of a parameter on the connected device
+
+        :param name: register address or corresponding :class:`ParamName` enum
+        :return: tuple of minimum and maximum value, None if the parameter has no range
+        """
+        return self._parameter_ranges[self._check_name(name)]
 
-        self.SettingInfo[SettingName.U_SET.value].value_range = [0, max_voltage]
-        self.SettingInfo[SettingName.I_SET.value].value_range = [0, max_current]
-        self.SettingInfo[SettingName.OVP.value].value_range = [0, voltage * 1.02]
-        self.SettingInfo[SettingName.OCP.value].value_range = [0, current * 1.01]
-        self.SettingInfo[SettingName.OPP.value].value_range = [0, current * voltage * 1.01]
+    def get_setting_range(self, name):
+        """
+        Get the allowed value range of a data group setting on the connected device
+
+        :param name: :class:`SettingName` enum or relative setting address
+        :return: tuple of minimum and maximum value, None if the setting has no range
+        """
+        address = name.value if isinstance(name, SettingName) else name
+        if not isinstance(address, int) or not 0 <= address < len(self._setting_ranges):
+            raise ValueError("The setting address is not known")
+        return self._setting_ranges[address]
 
     # ------------------------------------------------
     # Generic getters and setters for programmatic use
@@ -174,7 +649,16 @@ class PyDPS(minimalmodbus.Instrument):
         """
         address = self._check_name(name)
 
-        return self.read_register(address, 2)
+        return self.read_register(address, self._PARAMETER_DECIMALS[address])
+
+    def _read_parameter(self, name):
+        """
+        Read a single parameter, decoded according to the descriptor table
+
+        :param name: :class:`ParamName` enum of the parameter
+        :return: the decoded value of the queried modbus register
+        """
+        return self.read_register(name.value, self._PARAMETER_DECIMALS[name.value])
 
     def set_parameter(self, name, value):
         """
@@ -189,12 +673,9 @@ class PyDPS(minimalmodbus.Instrument):
         """
         address = self._check_name(name)
         self._check_writable(address)
-        boolean = self._check_value(address, value)
+        self._check_value(address, value)
 
-        if boolean:
-            self.write_register(address, value, 0)
-        else:
-            self.write_register(address, value, 2)
+        self.write_register(address, value, self._PARAMETER_DECIMALS[address])
 
     # -------------------------------
     # Get lists of parameters at once
@@ -206,21 +687,8 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(0x00, 13)
-        data = {
-            ParamName.U_SET: response[0] * 0.01,
-            ParamName.I_SET: response[1] * 0.01,
-            ParamName.U_OUT: round(response[2] * 0.01, 2),
-            ParamName.I_OUT: round(response[3] * 0.01, 2),
-            ParamName.P_OUT: round(response[4] * 0.01, 2),
-            ParamName.U_IN: response[5] * 0.01,
-            ParamName.LOCK: response[6],
-            ParamName.PROTECT: response[7],
-            ParamName.CV_CC: response[8],
-            ParamName.ON_OFF: response[9],
-            ParamName.B_LED: response[10],
-            ParamName.MODEL: response[11],
-            ParamName.VERSION: response[12],
-        }
+        data = self._decode_registers(0x00, response)
+        self._feed_accumulators(data)
         return data
 
     def get_all_variables(self):
@@ -230,19 +698,8 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(0x00, 11)
-        data = {
-            ParamName.U_SET: response[0] * 0.01,
-            ParamName.I_SET: response[1] * 0.01,
-            ParamName.U_OUT: round(response[2] * 0.01, 2),
-            ParamName.I_OUT: round(response[3] * 0.01, 2),
-            ParamName.P_OUT: round(response[4] * 0.01, 2),
-            ParamName.U_IN: response[5] * 0.01,
-            ParamName.LOCK: response[6],
-            ParamName.PROTECT: response[7],
-            ParamName.CV_CC: response[8],
-            ParamName.ON_OFF: response[9],
-            ParamName.B_LED: response[10]
-        }
+        data = self._decode_registers(0x00, response)
+        self._feed_accumulators(data)
         return data
 
     def get_all_measurements(self):
@@ -252,11 +709,8 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(ParamName.U_OUT.value, 4)
-        data = {
-            ParamName.U_OUT: round(response[0] * 0.01, 2),
-            ParamName.I_OUT: round(response[1] * 0.01, 2),
-            ParamName.P_OUT: round(response[2] * 0.01, 2),
-        }
+        data = self._decode_registers(ParamName.U_OUT.value, response[:3])
+        self._feed_accumulators(data)
         return data
 
     def get_set_values(self):
@@ -266,10 +720,7 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(ParamName.U_SET.value, 2)
-        data = {
-            ParamName.U_SET: round(response[0] * 0.01, 2),
-            ParamName.I_SET: round(response[1] * 0.01, 2),
-        }
+        data = self._decode_registers(ParamName.U_SET.value, response)
         return data
 
     def get_full_state_info(self):
@@ -279,12 +730,7 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(ParamName.LOCK.value, 4)
-        data = {
-            ParamName.LOCK: response[0],
-            ParamName.PROTECT: response[1],
-            ParamName.CV_CC: response[2],
-            ParamName.ON_OFF: response[3],
-        }
+        data = self._decode_registers(ParamName.LOCK.value, response)
         return data
 
     def get_device_info(self):
@@ -294,12 +740,275 @@ class PyDPS(minimalmodbus.Instrument):
         :return: Dictionary containing the returned values. Accessible via :class:ParamName enum
         """
         response = self.read_registers(ParamName.MODEL.value, 2)
-        data = {
-            ParamName.MODEL: response[0],
-            ParamName.VERSION: response[1],
-        }
+        data = self._decode_registers(ParamName.MODEL.value, response)
+        return data
+
+    def _decode_registers(self, address, response):
+        """
+        Scale a block of raw register values according to the descriptor table
+
+        :param address: register address of the first value
+        :param response: list of raw register values
+        :return: Dictionary containing the decoded values. Accessible via :class:ParamName enum
+        """
+        names = self._PARAMETER_NAMES
+        scales = self._PARAMETER_SCALES
+        decimals = self._PARAMETER_DECIMALS
+        data = {}
+        for index, value in enumerate(response, address):
+            if decimals[index]:
+                value = round(value * scales[index], decimals[index])
+            data[names[index]] = value
         return data
 
+    # --------------------------------------
+    # Transaction handling and thread safety
+    # --------------------------------------
+    def _perform_command(self, functioncode, payload):
+        """
+        Perform a ModBus transaction, routed through the I/O worker in thread safe mode
+
+        Overrides the :class:`minimalmodbus.Instrument` method, which is the single path of every read and write.
+
+        :param functioncode: ModBus function code
+        :param payload: payload to send to the slave
+        :return: payload returned by the slave
+        """
+        if self._closed:
+            raise ValueError("The instrument is closed")
+        if self._worker is None or threading.current_thread() is self._worker:
+            return self._execute(functioncode, payload)
+
+        key = (functioncode, payload)
+        shared = functioncode in self.SHARED_FUNCTION_CODES
+        with self._io_lock:
+            if self._closed:
+                raise ValueError("The instrument is closed")
+            stats = self._io_statistics
+            stats["requests"] += 1
+            transaction = self._in_flight.get(key) if shared else None
+            if transaction is not None:
+                stats["deduplicated"] += 1
+            else:
+                transaction = _Transaction(functioncode, payload)
+                if shared:
+                    self._in_flight[key] = transaction
+                if self._outstanding:
+                    stats["contended"] += 1
+                self._outstanding += 1
+                self._transactions.put(transaction)
+                stats["max_queue_depth"] = max(stats["max_queue_depth"], self._transactions.qsize())
+        self._local.transaction = transaction
+
+        start = time.monotonic()
+        transaction.done.wait()
+        waited = time.monotonic() - start
+        with self._io_lock:
+            self._io_statistics["total_wait_time"] += waited
+            self._io_statistics["max_wait_time"] = max(self._io_statistics["max_wait_time"], waited)
+
+        if transaction.error is not None:
+            raise transaction.error
+        return transaction.response
+
+    def _execute(self, functioncode, payload):
+        """
+        Execute a ModBus transaction on the serial port
+
+        If reconnection is enabled and the serial port fails, the port is reopened with exponential backoff and the
+        transaction is repeated until the reconnection timeout is exceeded.
+
+        :param functioncode: ModBus function code
+        :param payload: payload to send to the slave
+        :return: payload returned by the slave
+        """
+        deadline = None
+        delay = self.reconnect_delay
+        while True:
+            try:
+                if deadline is not None:
+                    self._reopen()
+                response = minimalmodbus.Instrument._perform_command(self, functioncode, payload)
+            except (serial.SerialException, OSError) as error:
+                if not self.reconnect or isinstance(error, minimalmodbus.ModbusException):
+                    raise
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self.reconnect_timeout
+                    continue
+                if now >= deadline:
+                    raise
+                time.sleep(min(delay, deadline - now))
+                delay = min(delay * 2, self.reconnect_max_delay)
+                continue
+            if deadline is not None:
+                self.reconnect_count += 1
+            return response
+
+    def _reopen(self):
+        """
+        Close and reopen the serial port, looking up the device node of the adapter again
+
+        :return:
+        """
+        try:
+            self.serial.close()
+        except (serial.SerialException, OSError):
+            pass
+        port = self._find_port(self.serial_number, self.location)
+        if port is not None and port != self.serial.port:
+            self.serial.port = port
+        self.serial.open()
+
+    @staticmethod
+    def _find_port(serial_number, location):
+        """
+        Find the device node of a USB-serial adapter by its serial number or location
+
+        :param serial_number: USB serial number of the adapter
+        :param location: USB location (path) of the adapter
+        :return: device node of the adapter, None if not found or not specified
+        """
+        if serial_number is None and location is None:
+            return None
+        for port in serial.tools.list_ports.comports():
+            if serial_number is not None and port.serial_number != serial_number:
+                continue
+            if location is not None and port.location != location:
+                continue
+            return port.device
+        return None
+
+    @staticmethod
+    def _io_worker(reference, transactions):
+        """
+        Main loop of the I/O worker thread, executing all queued transactions one after another
+
+        When the worker stops, the instance is marked as closed and all transactions still queued fail.
+
+        :param reference: weak reference to the :class:`PyDPS` instance
+        :param transactions: transaction queue of the instance
+        :return:
+        """
+        try:
+            while True:
+                transaction = transactions.get()
+                if transaction is None:
+                    break
+                instance = reference()
+                if instance is None:
+                    transactions.put(transaction)
+                    break
+                instance._run_transaction(transaction)
+                del instance
+        finally:
+            instance = reference()
+            if instance is not None:
+                with instance._io_lock:
+                    instance._closed = True
+            while True:
+                try:
+                    transaction = transactions.get_nowait()
+                except queue.Empty:
+                    break
+                if transaction is not None:
+                    transaction.error = ValueError("The instrument is closed")
+                    transaction.done.set()
+
+    def _run_transaction(self, transaction):
+        """
+        Execute a queued transaction and wake up all callers waiting for it
+
+        :param transaction: :class:`_Transaction` to execute
+        :return:
+        """
+        try:
+            transaction.response = self._execute(transaction.functioncode, transaction.payload)
+        except Exception as error:
+            transaction.error = error
+        finally:
+            with self._io_lock:
+                self._io_statistics["transactions"] += 1
+                self._outstanding -= 1
+                key = (transaction.functioncode, transaction.payload)
+                if self._in_flight.get(key) is transaction:
+                    del self._in_flight[key]
+            transaction.done.set()
+
+    def get_io_statistics(self):
+        """
+        Get contention and queue metrics of the I/O worker
+
+        The returned dictionary contains the number of ``requests`` by callers, executed ``transactions``, requests
+        answered by an already pending transaction (``deduplicated``), requests which had to wait behind other
+        transactions (``contended``), the current and maximum queue depth and the total and maximum time in seconds
+        callers waited for their response.
+
+        :return: Dictionary containing the I/O metrics
+        """
+        with self._io_lock:
+            stats = dict(self._io_statistics)
+        stats["queue_depth"] = self._transactions.qsize()
+        return stats
+
+    def close(self):
+        """
+        Stop the I/O worker, if running, and close the serial port
+
+        Transactions already queued are still executed, new requests fail afterwards.
+
+        :return:
+        """
+        with self._io_lock:
+            self._closed = True
+        if self._worker is not None:
+            self._stop_worker()
+            if threading.current_thread() is not self._worker:
+                self._worker.join()
+        self.serial.close()
+
+    # --------------------------------
+    # Streaming measurement processing
+    # --------------------------------
+    def add_accumulator(self, accumulator):
+        """
+        Attach an accumulator, which gets fed with the result of every measurement query
+
+        :param accumulator: :class:`MeasurementAccumulator` to attach
+        :return: the attached accumulator
+        """
+        self.accumulators.append(accumulator)
+        return accumulator
+
+    def remove_accumulator(self, accumulator):
+        """
+        Detach a previously attached accumulator
+
+        :param accumulator: :class:`MeasurementAccumulator` to detach
+        :return:
+        """
+        self.accumulators.remove(accumulator)
+
+    def _feed_accumulators(self, data):
+        """
+        Pass queried measurement data to all attached accumulators
+
+        In thread safe mode, callers sharing one transaction feed its data only once.
+
+        :param data: Dictionary containing the queried values. Accessible via :class:ParamName enum
+        :return:
+        """
+        if self.accumulators:
+            transaction = getattr(self._local, "transaction", None)
+            with self._accumulator_lock:
+                if transaction is not None:
+                    if transaction.fed:
+                        return
+                    transaction.fed = True
+                timestamp = time.monotonic()
+                for accumulator in self.accumulators:
+                    accumulator.add(data, timestamp)
+
     # ---------------------------------------------------------------
     # Boiler plate getters and setters, for easy use in console style
     # ---------------------------------------------------------------
@@ -445,7 +1154,7 @@ class PyDPS(minimalmodbus.Instrument):
 
         :return: DPS model number
         """
-        return self.get_parameter(ParamName.MODEL)
+        return float("%d.%02d" % self._split_model(self._read_parameter(ParamName.MODEL)))
 
     def get_firmware_version(self):
         """
@@ -469,7 +1178,7 @@ class PyDPS(minimalmodbus.Instrument):
             address = name.value
         else:
             address = name
-        if address not in self.ParameterInfo:
+        if not isinstance(address, int) or not 0 <= address < len(self._PARAMETER_WRITABLE):
             raise ValueError("The parameter address is not known")
         return address
 
@@ -480,11 +1189,7 @@ class PyDPS(minimalmodbus.Instrument):
         :param address: verified parameter address
         :return:
         """
-        if address in self.ParameterInfo:
-            writable = self.ParameterInfo[address].write
-        else:
-            writable = self.SettingInfo[address].write
-        if not writable:
+        if not self._PARAMETER_WRITABLE[address]:
             raise ValueError("The parameter is not writable")
 
     def _check_value(self, address, value):
@@ -495,15 +1200,10 @@ class PyDPS(minimalmodbus.Instrument):
         :param value: value to be written
         :return:
         """
-        if address in self.ParameterInfo:
-            info = self.ParameterInfo[address]
-        else:
-            info = self.SettingInfo[address]
-
-        value_range = info.value_range
+        value_range = self._parameter_ranges[address]
         if not value_range:
             raise ValueError("No value range is given")
         elif value < value_range[0] or value > value_range[1]:
             raise ValueError("Value outside of allowed range")
-
-        return info.integer
+        elif self._PARAMETER_INTEGER[address] and value != int(value):
+            raise ValueError("Only integer values are allowed")